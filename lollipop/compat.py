@@ -11,6 +11,7 @@ if PY2:
     iterkeys = lambda d: d.iterkeys()
     itervalues = lambda d: d.itervalues()
     iteritems = lambda d: d.iteritems()
+    viewkeys = (lambda d: set(d.keys())) if PY26 else (lambda d: d.viewkeys())
 else:
     string_types = (str,)
     int_types = (int,)
@@ -19,6 +20,7 @@ else:
     iterkeys = lambda d: d.keys()
     itervalues = lambda d: d.values()
     iteritems = lambda d: d.items()
+    viewkeys = lambda d: d.keys()
 
 if PY26:
     from .ordereddict import OrderedDict
@@ -26,12 +28,21 @@ if PY26:
 else:
     from collections import OrderedDict
     try:
-        from collections import (
+        from collections.abc import (
             MutableMapping as DictMixin,
             Mapping,
             Sequence)
     except ImportError:
-        from collections.abc import (
+        from collections import (
             MutableMapping as DictMixin,
             Mapping,
             Sequence)
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2 does not have lru_cache, so results are just not cached there
+    def lru_cache(maxsize=128):
+        def decorator(func):
+            return func
+        return decorator
@@ -1,4 +1,5 @@
-from lollipop.compat import iteritems, string_types
+from lollipop.compat import iteritems, viewkeys, string_types, lru_cache
+from lollipop.utils import slots_getstate, slots_setstate
 
 
 __all__ = [
@@ -35,87 +36,242 @@ class ValidationError(Exception):
         where keys are nested fields and values are error messages.
     """
     def __init__(self, messages):
-        super(ValidationError, self).__init__('Invalid data: %r' % messages)
+        # Message text is formatted lazily in __str__ as errors are often caught
+        # and merged without ever being printed
+        super(ValidationError, self).__init__(messages)
         # TODO: normalize messages
         self.messages = messages
 
+    def __str__(self):
+        return 'Invalid data: %r' % (self.messages,)
+
 
 class ErrorMessagesMixin(object):
+    """Mixin that provides error messages with defaults taken from
+    `default_error_messages` attribute of all classes in MRO.
+
+    Merged default error messages are computed on first instantiation and
+    cached per class, so `default_error_messages` should not be changed after
+    class has been instantiated: such changes are not seen by new instances.
+    Use `error_messages` argument or a subclass to customize messages instead.
+    """
+    __slots__ = ('_error_messages',)
+
     def __init__(self, error_messages=None, *args, **kwargs):
         super(ErrorMessagesMixin, self).__init__(*args, **kwargs)
-        self._error_messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            self._error_messages.update(getattr(cls, 'default_error_messages', {}))
-        self._error_messages.update(error_messages or {})
+        self._error_messages = dict(self._merged_default_error_messages())
+        if error_messages:
+            self._error_messages.update(error_messages)
+
+    __getstate__ = slots_getstate
+    __setstate__ = slots_setstate
+
+    @classmethod
+    def _merged_default_error_messages(cls):
+        """Returns default error messages of all classes in MRO merged
+        together. Result is computed once per class.
+        """
+        messages = cls.__dict__.get('_default_error_messages_cache')
+        if messages is None:
+            messages = {}
+            for klass in reversed(cls.__mro__):
+                messages.update(getattr(klass, 'default_error_messages', {}))
+            cls._default_error_messages_cache = messages
+        return messages
 
     def _fail(self, error_key, **kwargs):
-        if error_key not in self._error_messages:
-            msg = MISSING_ERROR_MESSAGE.format(
+        try:
+            msg = self._error_messages[error_key]
+        except KeyError:
+            raise ValueError(MISSING_ERROR_MESSAGE.format(
                 class_name=self.__class__.__name__,
                 error_key=error_key
-            )
-            raise ValueError(msg)
+            ))
 
-        msg = self._error_messages[error_key]
         if isinstance(msg, str):
             msg = msg.format(**kwargs)
 
         raise ValidationError(msg)
 
 
-def merge_errors(errors1, errors2):
+#: Minimal number of fields in merged error dict to make copying them in bulk
+#: cheaper than copying them one by one
+_BULK_MERGE_THRESHOLD = 16
+
+# Kinds of error messages merge_errors() distinguishes
+_LIST, _DICT, _OTHER = 0, 1, 2
+
+_ERROR_KINDS = dict(
+    [(list, _LIST), (dict, _DICT)] +
+    [(string_type, _OTHER) for string_type in string_types]
+)
+
+
+def _with_schema_errors(errors, schema_errors):
+    """Returns copy of dict of error messages with given object errors."""
+    errors = dict(errors)
+    errors[SCHEMA] = schema_errors
+    return errors
+
+
+def _merge_list_and_list(errors1, errors2):
+    return errors1 + errors2 if errors1 else errors2
+
+
+def _merge_list_and_dict(errors1, errors2):
+    if not errors1:
+        return errors2
+
+    return _with_schema_errors(
+        errors2, merge_errors(errors1, errors2.get(SCHEMA)),
+    )
+
+
+def _merge_list_and_other(errors1, errors2):
+    return errors1 + [errors2] if errors1 else errors2
+
+
+def _merge_dict_and_dict(errors1, errors2):
+    errors = dict(errors1)
+    if len(errors2) < _BULK_MERGE_THRESHOLD:
+        _merge_into(errors, errors2)
+        return errors
+
+    # Copy all fields in bulk and only merge ones present in both
+    errors.update(errors2)
+    for k in viewkeys(errors1) & viewkeys(errors2):
+        errors[k] = merge_errors(errors1[k], errors2[k])
+    return errors
+
+
+def _merge_dict_and_other(errors1, errors2):
+    return _with_schema_errors(
+        errors1, merge_errors(errors1.get(SCHEMA), errors2),
+    )
+
+
+def _merge_other_and_list(errors1, errors2):
+    return [errors1] + errors2 if errors2 else errors1
+
+
+def _merge_other_and_dict(errors1, errors2):
+    return _with_schema_errors(
+        errors2, merge_errors(errors1, errors2.get(SCHEMA)),
+    )
+
+
+def _merge_other_and_other(errors1, errors2):
+    return [errors1, errors2]
+
+
+# Merge functions indexed by kinds of first and second error messages
+_MERGERS = (
+    (_merge_list_and_list, _merge_list_and_dict, _merge_list_and_other),
+    (_merge_dict_and_other, _merge_dict_and_dict, _merge_dict_and_other),
+    (_merge_other_and_list, _merge_other_and_dict, _merge_other_and_other),
+)
+
+
+def _error_kind(errors):
+    if isinstance(errors, list):
+        return _LIST
+    elif isinstance(errors, dict):
+        return _DICT
+    return _OTHER
+
+
+def _deduplicate(errors):
+    """Removes repeated error messages from lists of error messages
+    (recursively), preserving order of first occurrences.
+    """
+    if isinstance(errors, list):
+        seen = set()
+        result = []
+        for error in errors:
+            try:
+                if error in seen:
+                    continue
+                seen.add(error)
+            except TypeError:
+                # Unhashable error messages (e.g. dicts) are compared one by one
+                if error in result:
+                    continue
+            result.append(error)
+        return result
+    elif isinstance(errors, dict):
+        return dict(
+            (k, _deduplicate(v)) for k, v in iteritems(errors)
+        )
+    return errors
+
+
+def merge_errors(errors1, errors2, dedup=False):
     """Deeply merges two error messages. Error messages can be
     string, list of strings or dict of error messages (recursively).
     Format is the same as accepted by :exc:`ValidationError`.
     Returns new error messages.
+
+    :param bool dedup: If True, repeated error messages in resulting
+        lists of messages are removed.
     """
     if errors1 is None:
-        return errors2
+        return _deduplicate(errors2) if dedup else errors2
     elif errors2 is None:
-        return errors1
-
-    if isinstance(errors1, list):
-        if not errors1:
-            return errors2
-
-        if isinstance(errors2, list):
-            return errors1 + errors2
-        elif isinstance(errors2, dict):
-            return dict(
-                errors2,
-                **{SCHEMA: merge_errors(errors1, errors2.get(SCHEMA))}
-            )
-        else:
-            return errors1 + [errors2]
-    elif isinstance(errors1, dict):
-        if isinstance(errors2, list):
-            return dict(
-                errors1,
-                **{SCHEMA: merge_errors(errors1.get(SCHEMA), errors2)}
-            )
-        elif isinstance(errors2, dict):
-            errors = dict(errors1)
-            for k, v in iteritems(errors2):
-                if k in errors:
-                    errors[k] = merge_errors(errors[k], v)
-                else:
-                    errors[k] = v
-            return errors
+        return _deduplicate(errors1) if dedup else errors1
+
+    # Exact type lookup is enough for common cases, subclasses of list and
+    # dict are handled with isinstance() checks
+    kind1 = _ERROR_KINDS.get(type(errors1))
+    if kind1 is None:
+        kind1 = _error_kind(errors1)
+    kind2 = _ERROR_KINDS.get(type(errors2))
+    if kind2 is None:
+        kind2 = _error_kind(errors2)
+
+    errors = _MERGERS[kind1][kind2](errors1, errors2)
+    return _deduplicate(errors) if dedup else errors
+
+
+def _merge_into(errors, other_errors):
+    """Merges dict of error messages `other_errors` into dict `errors` in place.
+    Nested error messages are never modified as they can be shared with other
+    error messages: conflicting ones are replaced with merge results.
+    """
+    for k, v in iteritems(other_errors):
+        if k in errors:
+            errors[k] = merge_errors(errors[k], v)
         else:
-            return dict(
-                errors1,
-                **{SCHEMA: merge_errors(errors1.get(SCHEMA), errors2)}
-            )
-    else:
-        if isinstance(errors2, list):
-            return [errors1] + errors2 if errors2 else errors1
-        elif isinstance(errors2, dict):
-            return dict(
-                errors2,
-                **{SCHEMA: merge_errors(errors1, errors2.get(SCHEMA))}
-            )
+            errors[k] = v
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path):
+    """Splits '.'-separated field path into tuple of field names.
+    Results are cached as the same paths are reported over and over again.
+    """
+    return tuple(path.split('.'))
+
+
+def _path_parts(path):
+    return _split_path(path) if isinstance(path, string_types) else (path,)
+
+
+def _build_errors(items):
+    """Builds dict of error messages from a list of (path parts, error) pairs.
+    Errors are grouped by field so every nested dict is built only once.
+    """
+    errors = {}
+    nested = {}
+    for parts, error in items:
+        if len(parts) == 1:
+            errors[parts[0]] = merge_errors(errors.get(parts[0]), error)
         else:
-            return [errors1, errors2]
+            nested.setdefault(parts[0], []).append((parts[1:], error))
+
+    for k, nested_items in iteritems(nested):
+        errors[k] = merge_errors(errors.get(k), _build_errors(nested_items))
+
+    return errors
 
 
 class ValidationErrorBuilder(object):
@@ -132,17 +288,25 @@ class ValidationErrorBuilder(object):
             ...
             builder.raise_errors()
     """
+    __slots__ = ('_errors', '_owns_errors')
 
     def __init__(self):
-        self.errors = None
-
-    def _make_error(self, path, error):
-        parts = path.split('.', 1) if isinstance(path, string_types) else [path]
-
-        if len(parts) == 1:
-            return {path: error}
-        else:
-            return {parts[0]: self._make_error(parts[1], error)}
+        self._errors = None
+        # Whether top level dict of errors was created by builder and was not
+        # given out, so that it can be safely updated in place
+        self._owns_errors = False
+
+    @property
+    def errors(self):
+        # Caller can keep reference to errors, so they should not change
+        # when more errors are added later
+        self._owns_errors = False
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
+        self._owns_errors = False
 
     def add_error(self, path, error):
         """Add error message for given field path.
@@ -157,7 +321,36 @@ class ValidationErrorBuilder(object):
         :param str path: '.'-separated list of field names
         :param str error: Error message
         """
-        self.errors = merge_errors(self.errors, self._make_error(path, error))
+        parts = _path_parts(path)
+
+        for part in reversed(parts[1:]):
+            error = {part: error}
+
+        if self._owns_errors and parts[0] not in self._errors:
+            # Field has no errors yet, so there is nothing to merge with
+            self._errors[parts[0]] = error
+        else:
+            self.add_errors({parts[0]: error})
+
+    def add_errors_from_iterable(self, errors):
+        """Add multiple error messages given as (field path, error) pairs.
+
+        Example: ::
+
+            builder = ValidationErrorBuilder()
+            builder.add_errors_from_iterable([
+                ('foo.bar', 'Error 1'),
+                ('foo.baz', 'Error 2'),
+            ])
+            print builder.errors
+            # => {'foo': {'bar': 'Error 1', 'baz': 'Error 2'}}
+
+        :param iterable errors: Pairs of '.'-separated field names
+            and error messages
+        """
+        items = [(_path_parts(path), error) for path, error in errors]
+        if items:
+            self.add_errors(_build_errors(items))
 
     def add_errors(self, errors):
         """Add errors in dict format.
@@ -172,11 +365,27 @@ class ValidationErrorBuilder(object):
 
         :param str, list or dict errors: Errors to merge
         """
-        self.errors = merge_errors(self.errors, errors)
+        previous = self._errors
+        if type(previous) is dict and type(errors) is dict:
+            if not self._owns_errors:
+                # Make own copy so that errors given out are not modified
+                self._errors = dict(previous)
+                self._owns_errors = True
+            _merge_into(self._errors, errors)
+            return
+
+        result = merge_errors(previous, errors)
+        if result is not previous:
+            # Merge results are new objects unless given errors were adopted
+            self._errors = result
+            self._owns_errors = type(result) is dict and result is not errors
 
     def raise_errors(self):
         """Raise :exc:`ValidationError` if errors are not empty;
         do nothing otherwise.
         """
-        if self.errors:
-            raise ValidationError(self.errors)
+        if self._errors:
+            # Raised exception keeps errors, so builder can not modify them
+            # if it is used after raising
+            self._owns_errors = False
+            raise ValidationError(self._errors)
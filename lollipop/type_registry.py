@@ -15,9 +15,15 @@ class TypeRef(Type):
     @property
     def inner_type(self):
         if self._inner_type is None:
-            self._inner_type = self._get_type()
+            self._bind(self._get_type())
         return self._inner_type
 
+    def _bind(self, inner_type):
+        self._inner_type = inner_type
+        # Shadow delegating methods so that calls go to inner type directly
+        self.load = inner_type.load
+        self.dump = inner_type.dump
+
     def load(self, *args, **kwargs):
         return self.inner_type.load(*args, **kwargs)
 
@@ -52,11 +58,14 @@ class TypeRegistry(object):
     def __init__(self):
         super(TypeRegistry, self).__init__()
         self._types = {}
+        self._refs = {}
 
     def add(self, name, a_type):
         if name in self._types:
             raise ValueError('Type with name "%s" is already registered' % name)
         self._types[name] = a_type
+        if name in self._refs:
+            self._refs[name]._bind(a_type)
         return a_type
 
     def _get(self, name):
@@ -65,7 +74,12 @@ class TypeRegistry(object):
         return self._types[name]
 
     def get(self, name):
-        return TypeRef(lambda: self._get(name))
+        ref = self._refs.get(name)
+        if ref is None:
+            ref = self._refs[name] = TypeRef(lambda: self._get(name))
+            if name in self._types:
+                ref._bind(self._types[name])
+        return ref
 
     def __getitem__(self, key):
         return self.get(key)
@@ -4,6 +4,7 @@ from lollipop.utils import is_sequence, is_mapping, make_context_aware, \
     constant, identity, OpenStruct, DictWithDefault
 from lollipop.compat import string_types, int_types, iteritems, OrderedDict
 import datetime
+import operator
 
 
 __all__ = [
@@ -39,6 +40,8 @@ __all__ = [
 ]
 
 class MissingType(object):
+    __slots__ = ()
+
     def __repr__(self):
         return '<MISSING>'
 
@@ -47,16 +50,83 @@ class MissingType(object):
 MISSING = MissingType()
 
 
+def _no_validation(data, context):
+    pass
+
+
+def _compile_validators(validators):
+    """Returns a function that takes data and context, runs all given
+    context-aware validators and raises :exc:`~lollipop.errors.ValidationError`
+    with combined messages of failed ones. Function is specialized for the number
+    of validators, so types with none or just one validator do not pay for
+    collecting errors.
+    """
+    validators = tuple(validators)
+
+    if not validators:
+        return _no_validation
+
+    if len(validators) == 1:
+        validator = validators[0]
+
+        def validate(data, context):
+            try:
+                validator(data, context)
+            except ValidationError as ve:
+                if ve.messages:
+                    raise
+
+        return validate
+
+    def validate(data, context):
+        errors = None
+        for validator in validators:
+            try:
+                validator(data, context)
+            except ValidationError as ve:
+                errors = merge_errors(errors, ve.messages)
+
+        if errors:
+            raise ValidationError(errors)
+
+    return validate
+
+
 class ValidatorCollection(object):
+    __slots__ = ('_validators', '_validate')
+
     def __init__(self, validators):
         self._validators = [make_context_aware(validator, 1)
                             for validator in validators]
+        self._compile()
+
+    def __getstate__(self):
+        # Compiled function is a closure, so only validators are pickled
+        return {'_validators': self._validators}
+
+    def __setstate__(self, state):
+        self._validators = state['_validators']
+        self._compile()
+
+    def _compile(self):
+        # Validators are rarely changed after type is created, so compiled
+        # function is rebuilt on every change and hot paths can call it directly
+        self._validate = _compile_validators(self._validators)
 
     def append(self, validator):
         self._validators.append(make_context_aware(validator, 1))
+        self._compile()
 
     def insert(self, idx, validator):
         self._validators.insert(idx, make_context_aware(validator, 1))
+        self._compile()
+
+    def __call__(self, data, context=None):
+        """Run all validators against given data. Raises
+        :exc:`~lollipop.errors.ValidationError` with combined messages of all
+        failed validators.
+        """
+        self._validate(data, context)
 
     def __len__(self):
         return len(self._validators)
@@ -66,9 +136,11 @@ class ValidatorCollection(object):
 
     def __setitem__(self, idx, validator):
         self._validators[idx] = make_context_aware(validator, 1)
+        self._compile()
 
     def __delitem__(self, idx):
         del self._validators[idx]
+        self._compile()
 
     def __iter__(self):
         for validator in self._validators:
@@ -95,6 +167,8 @@ class Type(ErrorMessagesMixin, object):
         * required - value is required
     """
 
+    __slots__ = ('name', 'description', '_validators', '__weakref__')
+
     default_error_messages = {
         'invalid': 'Invalid value type',
         'required': 'Value is required',
@@ -102,14 +176,23 @@ class Type(ErrorMessagesMixin, object):
 
     def __init__(self, name=None, description=None, validate=None, *args, **kwargs):
         super(Type, self).__init__(*args, **kwargs)
-        if validate is None:
-            validate = []
-        elif callable(validate):
-            validate = [validate]
-
         self.name = name
         self.description = description
-        self.validators = ValidatorCollection(validate)
+        self.validators = validate
+
+    @property
+    def validators(self):
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        if not isinstance(validators, ValidatorCollection):
+            if validators is None:
+                validators = []
+            elif callable(validators):
+                validators = [validators]
+            validators = ValidatorCollection(validators)
+        self._validators = validators
 
     def validate(self, data, context=None):
         """Takes serialized data and returns validation errors or None.
@@ -133,13 +216,7 @@ class Type(ErrorMessagesMixin, object):
         :returns: Loaded data
         :raises: :exc:`~lollipop.errors.ValidationError`
         """
-        errors_builder = ValidationErrorBuilder()
-        for validator in self.validators:
-            try:
-                validator(data, context)
-            except ValidationError as ve:
-                errors_builder.add_errors(ve.messages)
-        errors_builder.raise_errors()
+        self._validators._validate(data, context)
         return data
 
     def dump(self, value, context=None):
@@ -159,7 +236,8 @@ class Type(ErrorMessagesMixin, object):
 
 class Any(Type):
     """Any type. Does not transform/validate given data."""
-    pass
+
+    __slots__ = ()
 
 
 class Number(Type):
@@ -169,6 +247,9 @@ class Number(Type):
         * invalid - invalid value type. Interpolation data:
                 * data - actual value
     """
+
+    __slots__ = ()
+
     num_type = float
     default_error_messages = {
         'invalid': 'Value should be number',
@@ -186,16 +267,23 @@ class Number(Type):
         if data is MISSING or data is None:
             self._fail('required')
 
-        if isinstance(data, self._invalid_types):
-            self._fail('invalid')
+        # Values of exactly the target type do not need conversion
+        if data.__class__ is not self.num_type:
+            if isinstance(data, self._invalid_types):
+                self._fail('invalid')
 
-        return super(Number, self).load(self._normalize(data), *args, **kwargs)
+            data = self._normalize(data)
+
+        return super(Number, self).load(data, *args, **kwargs)
 
     def dump(self, value, *args, **kwargs):
         if value is MISSING or value is None:
             self._fail('required')
 
-        return super(Number, self).dump(self._normalize(value), *args, **kwargs)
+        if value.__class__ is not self.num_type:
+            value = self._normalize(value)
+
+        return super(Number, self).dump(value, *args, **kwargs)
 
 
 class Integer(Number):
@@ -206,6 +294,8 @@ class Integer(Number):
                 * data - actual value
     """
 
+    __slots__ = ()
+
     num_type = int
     default_error_messages = {
         'invalid': 'Value should be integer'
@@ -220,6 +310,8 @@ class Float(Number):
                 * data - actual value
     """
 
+    __slots__ = ()
+
     num_type = float
     default_error_messages = {
         'invalid': 'Value should be float'
@@ -234,6 +326,8 @@ class String(Type):
                 * data - actual value
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         'invalid': 'Value should be string',
     }
@@ -263,6 +357,8 @@ class Boolean(Type):
                 * data - actual value
     """
 
+    __slots__ = ()
+
     default_error_messages = {
         'invalid': 'Value should be boolean',
     }
@@ -315,6 +411,8 @@ class DateTime(Type):
                 * format - format string
     """
 
+    __slots__ = ('format',)
+
     FORMATS = {
         'iso': '%Y-%m-%dT%H:%M:%S%Z',  # shortcut for iso8601
         'iso8601': '%Y-%m-%dT%H:%M:%S%Z',
@@ -390,6 +488,8 @@ class Date(DateTime):
                 * format - format string
     """
 
+    __slots__ = ()
+
     FORMATS = {
         'iso': '%Y-%m-%d',  # shortcut for iso8601
         'iso8601': '%Y-%m-%d',
@@ -432,6 +532,8 @@ class Time(DateTime):
                 * format - format string
     """
 
+    __slots__ = ()
+
     FORMATS = {
         'iso': '%H:%M:%S',  # shortcut for iso8601
         'iso8601': '%H:%M:%S',
@@ -463,6 +565,9 @@ class List(Type):
         * invalid - invalid list value. Interpolation data:
                 * data - actual value
     """
+
+    __slots__ = ('item_type',)
+
     default_error_messages = {
         'invalid': 'Value should be list',
     }
@@ -478,14 +583,18 @@ class List(Type):
         if not is_sequence(data) or isinstance(data, string_types):
             self._fail('invalid', data=data)
 
-        errors_builder = ValidationErrorBuilder()
+        # Item indexes are unique, so errors are collected without merging
+        errors = {}
         items = []
+        append = items.append
+        load_item = self.item_type.load
         for idx, item in enumerate(data):
             try:
-                items.append(self.item_type.load(item, *args, **kwargs))
+                append(load_item(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
-        errors_builder.raise_errors()
+                errors[idx] = ve.messages
+        if errors:
+            raise ValidationError(errors)
 
         return super(List, self).load(items, *args, **kwargs)
 
@@ -496,14 +605,18 @@ class List(Type):
         if not is_sequence(value) or isinstance(value, string_types):
             self._fail('invalid', invalid=value)
 
-        errors_builder = ValidationErrorBuilder()
+        # Item indexes are unique, so errors are collected without merging
+        errors = {}
         items = []
+        append = items.append
+        dump_item = self.item_type.dump
         for idx, item in enumerate(value):
             try:
-                items.append(self.item_type.dump(item, *args, **kwargs))
+                append(dump_item(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
-        errors_builder.raise_errors()
+                errors[idx] = ve.messages
+        if errors:
+            raise ValidationError(errors)
 
         return super(List, self).dump(items, *args, **kwargs)
 
@@ -532,6 +645,9 @@ class Tuple(Type):
                 * expected_length
                 * actual_length
     """
+
+    __slots__ = ('item_types',)
+
     default_error_messages = {
         'invalid': 'Value should be list',
         'invalid_length': 'Value length should be {expected_length}',
@@ -553,14 +669,16 @@ class Tuple(Type):
                        expected_length=len(self.item_types),
                        actual_length=len(data))
 
-        errors_builder = ValidationErrorBuilder()
+        errors = {}
         result = []
+        append = result.append
         for idx, (item_type, item) in enumerate(zip(self.item_types, data)):
             try:
-                result.append(item_type.load(item, *args, **kwargs))
+                append(item_type.load(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
-        errors_builder.raise_errors()
+                errors[idx] = ve.messages
+        if errors:
+            raise ValidationError(errors)
 
         return tuple(super(Tuple, self).load(result, *args, **kwargs))
 
@@ -576,14 +694,16 @@ class Tuple(Type):
                        expected_length=len(self.item_types),
                        actual_length=len(value))
 
-        errors_builder = ValidationErrorBuilder()
+        errors = {}
         result = []
+        append = result.append
         for idx, (item_type, item) in enumerate(zip(self.item_types, value)):
             try:
-                result.append(item_type.dump(item, *args, **kwargs))
+                append(item_type.dump(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
-        errors_builder.raise_errors()
+                errors[idx] = ve.messages
+        if errors:
+            raise ValidationError(errors)
 
         return super(Tuple, self).dump(result, *args, **kwargs)
 
@@ -610,7 +730,7 @@ def dict_value_hint(key, mapper=None):
     To be used as a type hint in :class:`OneOf`.
     """
     if mapper is None:
-        mapper = identity
+        return operator.methodcaller('get', key)
 
     def hinter(data):
         return mapper(data.get(key))
@@ -723,6 +843,8 @@ class OneOf(Type):
                 * value
     """
 
+    __slots__ = ('types', 'load_hint', 'dump_hint')
+
     default_error_messages = {
         'invalid': 'Invalid data',
         'unknown_type_id': 'Unknown type ID: {type_id}',
@@ -744,10 +866,10 @@ class OneOf(Type):
 
         if is_mapping(self.types) and self.load_hint:
             type_id = self.load_hint(data)
-            if type_id not in self.types:
+            item_type = self.types.get(type_id, MISSING)
+            if item_type is MISSING:
                 self._fail('unknown_type_id', data=data, type_id=type_id)
 
-            item_type = self.types[type_id]
             result = item_type.load(data, *args, **kwargs)
             return super(OneOf, self).load(result, *args, **kwargs)
         else:
@@ -767,10 +889,10 @@ class OneOf(Type):
 
         if is_mapping(self.types) and self.dump_hint:
             type_id = self.dump_hint(data)
-            if type_id not in self.types:
+            item_type = self.types.get(type_id, MISSING)
+            if item_type is MISSING:
                 self._fail('unknown_type_id', data=data, type_id=type_id)
 
-            item_type = self.types[type_id]
             result = item_type.dump(data, *args, **kwargs)
             return super(OneOf, self).dump(result, *args, **kwargs)
         else:
@@ -791,6 +913,10 @@ class OneOf(Type):
         )
 
 
+def _is_plain_any(type_):
+    return type_.__class__ is Any and not len(type_.validators)
+
+
 class Dict(Type):
     """A dict type. You can specify either a single type for all dict values
     or provide a dict-like mapping object that will return proper Type instance
@@ -816,6 +942,8 @@ class Dict(Type):
                 * data - actual value
     """
 
+    __slots__ = ('value_types', 'key_type', 'ordered')
+
     default_error_messages = {
         'invalid': 'Value should be dict',
     }
@@ -830,25 +958,43 @@ class Dict(Type):
         self.key_type = key_type or Any()
         self.ordered = ordered
 
+    def _is_passthrough(self):
+        # Keys and values of any type without validators are copied as is
+        value_types = self.value_types
+        return value_types.__class__ is DictWithDefault and \
+            not len(value_types) and \
+            _is_plain_any(value_types.default) and \
+            _is_plain_any(self.key_type)
+
+    def _copy(self, data):
+        items = ((k, v) for k, v in iteritems(data)
+                 if k is not MISSING and v is not MISSING)
+        return OrderedDict(items) if self.ordered else dict(items)
+
     def load(self, data, *args, **kwargs):
         if data is MISSING or data is None:
             self._fail('required')
 
-        if not is_mapping(data):
+        if data.__class__ is not dict and not is_mapping(data):
             self._fail('invalid', data=data)
 
+        if self._is_passthrough():
+            return super(Dict, self).load(self._copy(data), *args, **kwargs)
+
         errors_builder = ValidationErrorBuilder()
         result = OrderedDict() if self.ordered else {}
+        load_key = self.key_type.load
+        get_value_type = self.value_types.get
         for k, v in iteritems(data):
             try:
-                k = self.key_type.load(k, *args, **kwargs)
+                k = load_key(k, *args, **kwargs)
             except ValidationError as ve:
                 errors_builder.add_error(k, ve.messages)
 
             if k is MISSING:
                 continue
 
-            value_type = self.value_types.get(k)
+            value_type = get_value_type(k)
             if value_type is None:
                 continue
 
@@ -878,18 +1024,23 @@ class Dict(Type):
         if value is MISSING or value is None:
             self._fail('required')
 
-        if not is_mapping(value):
+        if value.__class__ is not dict and not is_mapping(value):
             self._fail('invalid', data=value)
 
+        if self._is_passthrough():
+            return super(Dict, self).dump(self._copy(value), *args, **kwargs)
+
         errors_builder = ValidationErrorBuilder()
         result = OrderedDict() if self.ordered else {}
+        dump_key = self.key_type.dump
+        get_value_type = self.value_types.get
         for k, v in iteritems(value):
-            value_type = self.value_types.get(k)
+            value_type = get_value_type(k)
             if value_type is None:
                 continue
 
             try:
-                k = self.key_type.dump(k, *args, **kwargs)
+                k = dump_key(k, *args, **kwargs)
             except ValidationError as ve:
                 errors_builder.add_error(k, ve.messages)
 
@@ -939,6 +1090,8 @@ class Constant(Type):
                 * actual_value - actual value
     """
 
+    __slots__ = ('value', 'field_type')
+
     default_error_messages = {
         'required': 'Value is required',
         'value': 'Value is incorrect',
@@ -960,6 +1113,10 @@ class Constant(Type):
         return value
 
     def dump(self, value, *args, **kwargs):
+        if self.field_type.__class__ is Any:
+            # Any does not transform or validate values on dump
+            return self.value
+
         return self.field_type.dump(self.value, *args, **kwargs)
 
     def __repr__(self):
@@ -978,6 +1135,9 @@ class Field(ErrorMessagesMixin):
 
     :param Type field_type: Field type.
     """
+
+    __slots__ = ('field_type', '__weakref__')
+
     def __init__(self, field_type, *args, **kwargs):
         super(Field, self).__init__(*args, **kwargs)
         self.field_type = field_type
@@ -1033,13 +1193,17 @@ class Field(ErrorMessagesMixin):
         if value is MISSING:
             return
 
+        field_type = self.field_type
+        if not hasattr(field_type, 'load_into'):
+            # No need to fetch existing value if it can not be updated
+            return field_type.load(value, context=context)
+
         target = self.get_value(name, obj, context=context)
-        if target is not None and target is not MISSING \
-                and hasattr(self.field_type, 'load_into'):
-            return self.field_type.load_into(target, value, inplace=inplace,
-                                             context=context)
+        if target is not None and target is not MISSING:
+            return field_type.load_into(target, value, inplace=inplace,
+                                        context=context)
         else:
-            return self.field_type.load(value, context=context)
+            return field_type.load(value, context=context)
 
     def dump(self, name, obj, context=None):
         """Serialize data to primitive types. Raises
@@ -1071,6 +1235,9 @@ class AttributeField(Field):
         If callable, should take a single argument - name of field - and
         return name of corresponding object attribute to obtain value from.
     """
+
+    __slots__ = ('name_to_attribute',)
+
     def __init__(self, field_type, attribute=None, *args, **kwargs):
         super(AttributeField, self).__init__(field_type, *args, **kwargs)
         if attribute is None:
@@ -1080,10 +1247,16 @@ class AttributeField(Field):
         self.name_to_attribute = attribute
 
     def get_value(self, name, obj, context=None):
-        return getattr(obj, self.name_to_attribute(name), MISSING)
+        name_to_attribute = self.name_to_attribute
+        if name_to_attribute is not identity:
+            name = name_to_attribute(name)
+        return getattr(obj, name, MISSING)
 
     def set_value(self, name, obj, value, context=None):
-        setattr(obj, self.name_to_attribute(name), value)
+        name_to_attribute = self.name_to_attribute
+        if name_to_attribute is not identity:
+            name = name_to_attribute(name)
+        setattr(obj, name, value)
 
 
 class IndexField(Field):
@@ -1097,6 +1270,9 @@ class IndexField(Field):
         If callable, should take a single argument - name of field - and
         return name of corresponding object key to obtain value from.
     """
+
+    __slots__ = ('name_to_key',)
+
     def __init__(self, field_type, key=None, *args, **kwargs):
         super(IndexField, self).__init__(field_type, *args, **kwargs)
         if key is None:
@@ -1106,13 +1282,19 @@ class IndexField(Field):
         self.name_to_key = key
 
     def get_value(self, name, obj, context=None):
+        name_to_key = self.name_to_key
+        if name_to_key is not identity:
+            name = name_to_key(name)
         try:
-            return obj[self.name_to_key(name)]
+            return obj[name]
         except KeyError:
             return MISSING
 
     def set_value(self, name, obj, value, context=None):
-        obj[self.name_to_key(name)] = value
+        name_to_key = self.name_to_key
+        if name_to_key is not identity:
+            name = name_to_key(name)
+        obj[name] = value
 
 
 class MethodField(Field):
@@ -1146,6 +1328,9 @@ class MethodField(Field):
         Referenced method should take 1 argument - new field value to set.
     :param kwargs: Same keyword arguments as for :class:`Field`.
     """
+
+    __slots__ = ('get_method', 'set_method')
+
     def __init__(self, field_type, get=None, set=None, *args, **kwargs):
         super(MethodField, self).__init__(field_type, *args, **kwargs)
         if get is not None:
@@ -1162,9 +1347,9 @@ class MethodField(Field):
             return MISSING
 
         method_name = self.get_method(name)
-        if not hasattr(obj, method_name):
+        method = getattr(obj, method_name, MISSING)
+        if method is MISSING:
             raise ValueError('Object does not have method %s' % method_name)
-        method = getattr(obj, method_name)
         if not callable(method):
             raise ValueError('Value of %s is not callable' % method_name)
         return make_context_aware(method, 0)(context)
@@ -1174,9 +1359,9 @@ class MethodField(Field):
             return MISSING
 
         method_name = self.set_method(name)
-        if not hasattr(obj, method_name):
+        method = getattr(obj, method_name, MISSING)
+        if method is MISSING:
             raise ValueError('Object does not have method %s' % method_name)
-        method = getattr(obj, method_name)
         if not callable(method):
             raise ValueError('Value of %s is not callable' % method_name)
         return make_context_aware(method, 1)(value, context)
@@ -1206,6 +1391,9 @@ class FunctionField(Field):
     :param callable set: Function that takes source object and new field value
         and sets that value to object field. Function return value is ignored.
     """
+
+    __slots__ = ('get_func', 'set_func')
+
     def __init__(self, field_type, get=None, set=None, *args, **kwargs):
         super(FunctionField, self).__init__(field_type, *args, **kwargs)
         if get is not None and not callable(get):
@@ -1232,8 +1420,62 @@ class FunctionField(Field):
         self.set_func(obj, value, context)
 
 
+def _raise_field_errors(errors):
+    """Raises :exc:`~lollipop.errors.ValidationError` with errors collected
+    per field name. Names still go through
+    :class:`~lollipop.errors.ValidationErrorBuilder`, so '.'-separated names
+    are reported as nested errors.
+    """
+    errors_builder = ValidationErrorBuilder()
+    errors_builder.add_errors_from_iterable(iteritems(errors))
+    errors_builder.raise_errors()
+
+
+class _FieldsDict(OrderedDict):
+    """Ordered mapping of resolved :class:`Object` fields.
+
+    Caches a tuple of (name, field) pairs and a set of field names, as
+    iterating a tuple and checking a set are much cheaper than doing the same
+    with OrderedDict on every load/dump. Caches are dropped whenever fields
+    are modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._items = None
+        self._names = None
+        super(_FieldsDict, self).__init__(*args, **kwargs)
+
+    def field_items(self):
+        if self._items is None:
+            self._items = tuple(iteritems(self))
+        return self._items
+
+    def field_names(self):
+        if self._names is None:
+            self._names = frozenset(self)
+        return self._names
+
+
+def _invalidating_fields_cache(method):
+    def wrapper(self, *args, **kwargs):
+        self._items = None
+        self._names = None
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+for _name in ('__setitem__', '__delitem__', '__ior__', 'clear', 'pop',
+              'popitem', 'setdefault', 'update', 'move_to_end'):
+    if hasattr(OrderedDict, _name):
+        setattr(_FieldsDict, _name,
+                _invalidating_fields_cache(getattr(OrderedDict, _name)))
+del _name
+
+
 def inheritable_property(name):
-    cache_attr = '__' + name
+    cache_attr = '_cached_' + name
 
     @property
     def getter(self):
@@ -1316,6 +1558,13 @@ class Object(Type):
         * unknown - reported for unknown fields
     """
 
+    __slots__ = ('bases', '_default_field_type', '_constructor',
+                 '_allow_extra_fields', '_immutable', '_ordered', '_only',
+                 '_exclude', '_fields', '_resolved_fields',
+                 '_cached_default_field_type', '_cached_constructor',
+                 '_cached_allow_extra_fields', '_cached_immutable',
+                 '_cached_ordered')
+
     default_error_messages = {
         'invalid': 'Value should be dict',
         'unknown': 'Unknown field',
@@ -1364,10 +1613,21 @@ class Object(Type):
     @property
     def fields(self):
         if not hasattr(self, '_resolved_fields'):
-            self._resolved_fields = self._resolve_fields(self.bases, self._fields,
-                                                         self._only, self._exclude)
+            fields = self._resolve_fields(self.bases, self._fields,
+                                          self._only, self._exclude)
+            if not isinstance(fields, _FieldsDict):
+                fields = _FieldsDict(fields)
+            self._resolved_fields = fields
         return self._resolved_fields
 
+    @property
+    def _field_items(self):
+        return self.fields.field_items()
+
+    @property
+    def _field_names(self):
+        return self.fields.field_names()
+
     default_field_type = inheritable_property('default_field_type')
     constructor = inheritable_property('constructor')
     allow_extra_fields = inheritable_property('allow_extra_fields')
@@ -1404,50 +1664,59 @@ class Object(Type):
                                     if is_mapping(fields) else fields)
             ]
 
-        return OrderedDict(all_fields)
+        return _FieldsDict(all_fields)
 
     def load(self, data, *args, **kwargs):
         if data is MISSING or data is None:
             self._fail('required')
 
-        if not is_mapping(data):
+        if data.__class__ is not dict and not is_mapping(data):
             self._fail('invalid', data=data)
 
-        errors_builder = ValidationErrorBuilder()
+        # Resolve inheritable properties once per call
+        field_items = self._field_items
+        allow_extra_fields = self.allow_extra_fields
+        constructor = self.constructor
+
+        errors = {}
         result = {}
 
-        for name, field in iteritems(self.fields):
+        for name, field in field_items:
             try:
                 loaded = field.load(name, data, *args, **kwargs)
-                if loaded != MISSING:
+                if loaded is not MISSING:
                     result[name] = loaded
             except ValidationError as ve:
-                errors_builder.add_error(name, ve.messages)
+                errors[name] = ve.messages
 
-        if self.allow_extra_fields is False:
-            field_names = [name for name, _ in iteritems(self.fields)]
+        if allow_extra_fields is False:
+            field_names = self._field_names
+            unknown_message = self._error_messages['unknown']
             for name in data:
                 if name not in field_names:
-                    errors_builder.add_error(name, self._error_messages['unknown'])
-        elif isinstance(self.allow_extra_fields, Field):
-            field_names = [name for name, _ in iteritems(self.fields)]
+                    errors[name] = unknown_message
+        elif isinstance(allow_extra_fields, Field):
+            field_names = self._field_names
             for name in data:
                 if name not in field_names:
                     try:
-                        loaded = self.allow_extra_fields.load(
+                        loaded = allow_extra_fields.load(
                             name, data, *args, **kwargs
                         )
-                        if loaded != MISSING:
+                        if loaded is not MISSING:
                             result[name] = loaded
                     except ValidationError as ve:
-                        errors_builder.add_error(name, ve.messages)
+                        errors[name] = ve.messages
 
-        errors_builder.raise_errors()
+        if errors:
+            _raise_field_errors(errors)
 
-        result = super(Object, self).load(result, *args, **kwargs)
+        if self.validators:
+            # Whole object validators are rarely used
+            result = super(Object, self).load(result, *args, **kwargs)
 
-        result = self.constructor(**result) \
-            if self.constructor else OpenStruct(result)
+        result = constructor(**result) \
+            if constructor else OpenStruct(result)
 
         return result
 
@@ -1471,18 +1740,24 @@ class Object(Type):
         if data is None:
             self._fail('required')
 
-        if not is_mapping(data):
+        if data.__class__ is not dict and not is_mapping(data):
             self._fail('invalid', data=data)
 
-        errors_builder = ValidationErrorBuilder()
+        # Resolve inheritable properties once per call
+        fields = self.fields
+        field_items = self._field_items
+        allow_extra_fields = self.allow_extra_fields
+        immutable = self.immutable
+
+        errors = {}
 
         data1 = {}
-        for name, field in iteritems(self.fields):
+        for name, field in field_items:
             try:
                 if name in data:
                     # Load new data
                     value = field.load_into(obj, name, data,
-                                            inplace=not self.immutable and inplace,
+                                            inplace=not immutable and inplace,
                                             *args, **kwargs)
                 else:
                     # Retrive data from existing object
@@ -1493,39 +1768,44 @@ class Object(Type):
                 if value is not MISSING:
                     data1[name] = value
             except ValidationError as ve:
-                errors_builder.add_error(name, ve.messages)
+                errors[name] = ve.messages
 
-        if self.allow_extra_fields is False:
-            field_names = [name for name, _ in iteritems(self.fields)]
+        if allow_extra_fields is False:
+            field_names = self._field_names
+            unknown_message = self._error_messages['unknown']
             for name in data:
                 if name not in field_names:
-                    errors_builder.add_error(name, self._error_messages['unknown'])
-        elif isinstance(self.allow_extra_fields, Field):
-            field_names = [name for name, _ in iteritems(self.fields)]
+                    errors[name] = unknown_message
+        elif isinstance(allow_extra_fields, Field):
+            field_names = self._field_names
             for name in data:
                 if name not in field_names:
                     try:
-                        loaded = self.allow_extra_fields.load_into(
+                        loaded = allow_extra_fields.load_into(
                             obj, name, data,
-                            inplace=not self.immutable and inplace,
+                            inplace=not immutable and inplace,
                             *args, **kwargs
                         )
-                        if loaded != MISSING:
+                        if loaded is not MISSING:
                             data1[name] = loaded
                     except ValidationError as ve:
-                        errors_builder.add_error(name, ve.messages)
+                        errors[name] = ve.messages
 
-        errors_builder.raise_errors()
+        if errors:
+            _raise_field_errors(errors)
 
-        data2 = super(Object, self).load(data1, *args, **kwargs)
+        if self.validators:
+            data2 = super(Object, self).load(data1, *args, **kwargs)
+        else:
+            data2 = data1
 
-        if self.immutable or not inplace:
+        if immutable or not inplace:
             result = data2
             if self.constructor:
                 result = self.constructor(**result)
         else:
             for name, value in iteritems(data2):
-                field = self.fields.get(name, self.allow_extra_fields)
+                field = fields.get(name, allow_extra_fields)
                 if not isinstance(field, Field):
                     continue
 
@@ -1557,17 +1837,18 @@ class Object(Type):
         if obj is MISSING or obj is None:
             self._fail('required')
 
-        errors_builder = ValidationErrorBuilder()
+        errors = {}
         result = OrderedDict() if self.ordered else {}
 
-        for name, field in iteritems(self.fields):
+        for name, field in self._field_items:
             try:
                 dumped = field.dump(name, obj, *args, **kwargs)
-                if dumped != MISSING:
+                if dumped is not MISSING:
                     result[name] = dumped
             except ValidationError as ve:
-                errors_builder.add_error(name, ve.messages)
-        errors_builder.raise_errors()
+                errors[name] = ve.messages
+        if errors:
+            _raise_field_errors(errors)
 
         return super(Object, self).dump(result, *args, **kwargs)
 
@@ -1586,6 +1867,9 @@ class Modifier(Type):
 
     :param Type inner_type: Actual type that should be optional.
     """
+
+    __slots__ = ('inner_type',)
+
     def __init__(self, inner_type, **kwargs):
         super(Modifier, self).__init__(
             **dict({'name': inner_type.name,
@@ -1607,6 +1891,16 @@ class Modifier(Type):
         )
 
 
+def _constant_default(value):
+    """Returns context-aware function that always returns given value.
+    Unlike :func:`~lollipop.utils.constant` it has fixed arity, so calling it
+    does not pack arguments.
+    """
+    def default(context=None):
+        return value
+    return default
+
+
 class Optional(Modifier):
     """A modifier which makes values optional: if value is missing or None,
     it will not transform it with an inner type but instead will return None
@@ -1632,16 +1926,17 @@ class Optional(Modifier):
         arguments to get value to use when value is missing on serialization.
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
+
+    __slots__ = ('load_default', 'dump_default')
+
     def __init__(self, inner_type,
                  load_default=None, dump_default=None,
                  **kwargs):
         super(Optional, self).__init__(inner_type, **kwargs)
-        if not callable(load_default):
-            load_default = constant(load_default)
-        if not callable(dump_default):
-            dump_default = constant(dump_default)
-        self.load_default = make_context_aware(load_default, 0)
-        self.dump_default = make_context_aware(dump_default, 0)
+        self.load_default = make_context_aware(load_default, 0) \
+            if callable(load_default) else _constant_default(load_default)
+        self.dump_default = make_context_aware(dump_default, 0) \
+            if callable(dump_default) else _constant_default(dump_default)
 
     def load(self, data, context=None, *args, **kwargs):
         if data is MISSING or data is None:
@@ -1679,6 +1974,9 @@ class LoadOnly(Modifier):
 
     :param Type inner_type: Data type.
     """
+
+    __slots__ = ()
+
     def load(self, data, *args, **kwargs):
         return self.inner_type.load(data, *args, **kwargs)
 
@@ -1699,6 +1997,9 @@ class DumpOnly(Modifier):
 
     :param Type inner_type: Data type.
     """
+
+    __slots__ = ()
+
     def load(self, data, *args, **kwargs):
         return MISSING
 
@@ -1706,6 +2007,19 @@ class DumpOnly(Modifier):
         return self.inner_type.dump(data, *args, **kwargs)
 
 
+def _identity_hook(value, context=None):
+    return value
+
+
+def _make_transform_hook(func):
+    """Returns context-aware version of given transform hook. Unset hooks
+    (identity) are replaced with a function that does not wrap identity call.
+    """
+    if func is identity:
+        return _identity_hook
+    return make_context_aware(func, 1)
+
+
 class Transform(Modifier):
     """A wrapper type which allows us to convert data structures to an inner type,
     then loaded or dumped with a customized format.
@@ -1740,14 +2054,17 @@ class Transform(Modifier):
         Argument should be a callable taking one argument - value - and returning
         updated value. Optionally it can take a second argument - context.
     """
+
+    __slots__ = ('pre_load', 'post_load', 'pre_dump', 'post_dump')
+
     def __init__(self, inner_type,
                  pre_load=identity, post_load=identity,
                  pre_dump=identity, post_dump=identity):
         super(Transform, self).__init__(inner_type)
-        self.pre_load = make_context_aware(pre_load, 1)
-        self.post_load = make_context_aware(post_load, 1)
-        self.pre_dump = make_context_aware(pre_dump, 1)
-        self.post_dump = make_context_aware(post_dump, 1)
+        self.pre_load = _make_transform_hook(pre_load)
+        self.post_load = _make_transform_hook(post_load)
+        self.pre_dump = _make_transform_hook(pre_dump)
+        self.post_dump = _make_transform_hook(post_dump)
 
     def load(self, data, context=None):
         return self.post_load(
@@ -1,6 +1,8 @@
 import inspect
 import re
-from lollipop.compat import DictMixin, Sequence, Mapping, iterkeys, PY2
+import weakref
+from lollipop.compat import DictMixin, Sequence, Mapping, iterkeys, PY2, \
+    lru_cache, iteritems, string_types
 
 
 def identity(value):
@@ -16,11 +18,12 @@ def constant(value):
 
 def is_sequence(value):
     """Returns True if value supports list interface; False - otherwise"""
-    return isinstance(value, Sequence)
+    # Check builtin types first to avoid slower ABC instance check
+    return isinstance(value, (list, tuple)) or isinstance(value, Sequence)
 
 def is_mapping(value):
     """Returns True if value supports dict interface; False - otherwise"""
-    return isinstance(value, Mapping)
+    return isinstance(value, dict) or isinstance(value, Mapping)
 
 def get_arg_count(func):
     """Calculates a number of arguments based on a signature."""
@@ -33,6 +36,23 @@ def get_arg_count(func):
     return len(spec.args) + len(spec.kwonlyargs)
 
 
+# Weak keys do not keep user callbacks and everything they reference alive
+_arg_counts = weakref.WeakKeyDictionary()
+
+
+def _get_function_arg_count(func):
+    # Signature inspection is slow and bound methods are created anew on every
+    # attribute access, so argument counts are cached by underlying function
+    try:
+        return _arg_counts[func]
+    except KeyError:
+        arg_count = _arg_counts[func] = get_arg_count(func)
+        return arg_count
+    except TypeError:
+        # Function is unhashable or does not support weak references
+        return get_arg_count(func)
+
+
 # Backward compatibility
 is_list = is_sequence
 is_dict = is_mapping
@@ -46,9 +66,9 @@ def make_context_aware(func, numargs):
     """
     try:
         if inspect.ismethod(func):
-            arg_count = get_arg_count(func) - 1
+            arg_count = _get_function_arg_count(func.__func__) - 1
         elif inspect.isfunction(func):
-            arg_count = get_arg_count(func)
+            arg_count = _get_function_arg_count(func)
         elif inspect.isclass(func):
             arg_count = get_arg_count(func.__init__) - 1
         else:
@@ -57,8 +77,20 @@ def make_context_aware(func, numargs):
         arg_count = numargs
 
     if arg_count <= numargs:
-        def normalized(*args):
-            return func(*args[:-1])
+        # Fixed arity wrappers for common cases avoid packing and slicing
+        # arguments on every call
+        if numargs == 0:
+            def normalized(context):
+                return func()
+        elif numargs == 1:
+            def normalized(arg, context):
+                return func(arg)
+        elif numargs == 2:
+            def normalized(arg1, arg2, context):
+                return func(arg1, arg2)
+        else:
+            def normalized(*args):
+                return func(*args[:-1])
 
         return normalized
 
@@ -73,25 +105,70 @@ def call_with_context(func, context, *args):
     return make_context_aware(func, len(args))(*args + (context,))
 
 
+_CAMEL_CASE_BOUNDARY = re.compile('([^_A-Z])([A-Z])')
+_SNAKE_CASE_BOUNDARY = re.compile('_([a-z])')
+
+
+@lru_cache(maxsize=512)
 def to_snake_case(s):
     """Converts camel-case identifiers to snake-case."""
-    return re.sub('([^_A-Z])([A-Z])', lambda m: m.group(1) + '_' + m.group(2).lower(), s)
+    return _CAMEL_CASE_BOUNDARY.sub(
+        lambda m: m.group(1) + '_' + m.group(2).lower(), s,
+    )
 
 
+@lru_cache(maxsize=512)
 def to_camel_case(s):
     """Converts snake-case identifiers to camel-case."""
-    return re.sub('_([a-z])', lambda m: m.group(1).upper(), s)
+    return _SNAKE_CASE_BOUNDARY.sub(lambda m: m.group(1).upper(), s)
+
+
+def _iter_slots(cls):
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, string_types):
+            slots = (slots,)
+        for name in slots:
+            if name not in ('__dict__', '__weakref__'):
+                yield klass.__dict__[name]
+
+
+def slots_getstate(self):
+    """Implementation of `__getstate__` for classes with `__slots__`.
+    Returns values of all set slots and instance `__dict__` (if any) as dict.
+    Python 2 and older pickle protocols can not pickle such objects otherwise.
+    """
+    state = dict(getattr(self, '__dict__', None) or {})
+    for slot in _iter_slots(self.__class__):
+        try:
+            state[slot.__name__] = slot.__get__(self, self.__class__)
+        except AttributeError:
+            pass
+    return state
+
+
+def slots_setstate(self, state):
+    """Implementation of `__setstate__` for state returned by
+    :func:`slots_getstate`.
+    """
+    for name, value in iteritems(state):
+        object.__setattr__(self, name, value)
 
 
 _default = object()
 
 
 class DictWithDefault(DictMixin, object):
-    def __init__(self, values={}, default=None):
+    __slots__ = ('_values', 'default')
+
+    def __init__(self, values=None, default=None):
         super(DictWithDefault, self).__init__()
-        self._values = values
+        self._values = {} if values is None else values
         self.default = default
 
+    __getstate__ = slots_getstate
+    __setstate__ = slots_setstate
+
     def __len__(self):
         return len(self._values)
 
@@ -125,19 +202,20 @@ class DictWithDefault(DictMixin, object):
     def keys(self):
         return self._values.keys()
 
-    def iterkeys(self):
-        for k in iterkeys(self._values):
-            yield k
-
-    def iteritems(self):
-        for k, v in self._values.iteritems():
-            yield k, v
-
 
 class OpenStruct(DictMixin):
     """A dictionary that also allows accessing values through object attributes."""
+    __slots__ = ('_data',)
+
     def __init__(self, data=None):
-        self.__dict__.update({'_data': data or {}})
+        object.__setattr__(self, '_data', data or {})
+
+    def __getstate__(self):
+        # Empty state is not passed to __setstate__, so data is wrapped
+        return (self._data,)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_data', state[0])
 
     def __getitem__(self, key):
         return self._data[key]
@@ -173,17 +251,19 @@ class OpenStruct(DictMixin):
         return name in self._data
 
     def __getattr__(self, name):
-        if name not in self._data:
+        value = self._data.get(name, _default)
+        if value is _default:
             raise AttributeError(name)
-        return self._data[name]
+        return value
 
     def __setattr__(self, name, value):
         self._data[name] = value
 
     def __delattr__(self, name):
-        if name not in self._data:
+        try:
+            del self._data[name]
+        except KeyError:
             raise AttributeError(name)
-        del self._data[name]
 
     def __repr__(self):
         return '<%s %s>' % (
@@ -1,7 +1,8 @@
 from lollipop.errors import ValidationError, ValidationErrorBuilder, \
     ErrorMessagesMixin
-from lollipop.compat import string_types, iteritems
+from lollipop.compat import string_types, int_types, iteritems
 from lollipop.utils import make_context_aware, is_sequence, identity
+from itertools import islice
 import re
 
 
@@ -18,6 +19,21 @@ __all__ = [
 ]
 
 
+def _make_lookup(values):
+    """Returns frozenset of given values to speed up membership tests.
+    Falls back to values themselves if they are not a tuple or contain
+    unhashable items. Mutable sequences are not converted as they can be
+    changed in place.
+    """
+    if not isinstance(values, tuple):
+        return values
+
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
 class Validator(ErrorMessagesMixin, object):
     """Base class for all validators.
 
@@ -29,6 +45,8 @@ class Validator(ErrorMessagesMixin, object):
     ignored.
     """
 
+    __slots__ = ()
+
     def __call__(self, value, context=None):
         """Validate value. In case of errors, raise
         :exc:`~lollipop.errors.ValidationError`. Return value is always ignored.
@@ -47,6 +65,8 @@ class Predicate(Validator):
         Can be interpolated with ``data``.
     """
 
+    __slots__ = ('predicate', 'error')
+
     default_error_messages = {
         'invalid': 'Invalid data',
     }
@@ -78,6 +98,8 @@ class Range(Validator):
         Can be interpolated with ``data``, ``min`` or ``max``.
     """
 
+    __slots__ = ('min', 'max')
+
     default_error_messages = {
         'min': 'Value should be at least {min}',
         'max': 'Value should be at most {max}',
@@ -126,6 +148,9 @@ class Length(Validator):
     :param str error: Error message in case of validation error.
         Can be interpolated with ``data``, ``length``, ``exact``, ``min`` or ``max``.
     """
+
+    __slots__ = ('exact', 'min', 'max')
+
     default_error_messages = {
         'exact': 'Length should be {exact}',
         'min': 'Length should be at least {min}',
@@ -185,6 +210,8 @@ class NoneOf(Validator):
         Can be interpolated with ``data`` and ``values``.
     """
 
+    __slots__ = ('_values', '_lookup')
+
     default_error_messages = {
         'invalid': 'Invalid data',
     }
@@ -195,9 +222,26 @@ class NoneOf(Validator):
         if error is not None:
             self._error_messages['invalid'] = error
 
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self._lookup = _make_lookup(values)
+
     def __call__(self, value, context=None):
-        if value in self.values:
-            self._fail('invalid', data=value, values=self.values)
+        try:
+            if value not in self._lookup:
+                return
+        except TypeError:
+            # Unhashable value can not be looked up in a set; errors from
+            # value comparison are raised again by sequence lookup
+            if value not in self._values:
+                return
+
+        self._fail('invalid', data=value, values=self._values)
 
     def __repr__(self):
         return '<{klass} {values}>'.format(
@@ -214,6 +258,8 @@ class AnyOf(Validator):
         Can be interpolated with ``data`` and ``choices``.
     """
 
+    __slots__ = ('_choices', '_lookup')
+
     default_error_messages = {
         'invalid': 'Invalid choice',
     }
@@ -224,9 +270,26 @@ class AnyOf(Validator):
         if error is not None:
             self._error_messages['invalid'] = error
 
+    @property
+    def choices(self):
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices):
+        self._choices = choices
+        self._lookup = _make_lookup(choices)
+
     def __call__(self, value, context=None):
-        if value not in self.choices:
-            self._fail('invalid', data=value, choices=self.choices)
+        try:
+            if value in self._lookup:
+                return
+        except TypeError:
+            # Unhashable value can not be looked up in a set; errors from
+            # value comparison are raised again by sequence lookup
+            if value in self._choices:
+                return
+
+        self._fail('invalid', data=value, choices=self._choices)
 
     def __repr__(self):
         return '<{klass} {choices}>'.format(
@@ -245,6 +308,8 @@ class Regexp(Validator):
         Can be interpolated with ``data`` and ``regexp``.
     """
 
+    __slots__ = ('regexp', '_match')
+
     default_error_messages = {
         'invalid': 'String does not match expected pattern',
     }
@@ -254,11 +319,12 @@ class Regexp(Validator):
         if isinstance(regexp, string_types):
             regexp = re.compile(regexp, flags)
         self.regexp = regexp
+        self._match = regexp.match
         if error is not None:
             self._error_messages['invalid'] = error
 
     def __call__(self, value, context=None):
-        if self.regexp.match(value) is None:
+        if self._match(value) is None:
             self._fail('invalid', data=value, regexp=self.regexp.pattern)
 
     def __repr__(self):
@@ -279,6 +345,8 @@ class Unique(Validator):
         and ``key`` (uniquness key that is not unique).
     """
 
+    __slots__ = ('key',)
+
     default_error_messages = {
         'invalid': 'Value should be collection',
         'unique': 'Values are not unique',
@@ -312,6 +380,9 @@ class Each(Validator):
     :param validators: Validator or list of validators to run against each element
         of collection.
     """
+
+    __slots__ = ('validators',)
+
     default_error_messages = {
         'invalid': 'Value should be collection',
     }
@@ -322,13 +393,39 @@ class Each(Validator):
             validators = [validators]
         self.validators = validators
 
+    def _count_in_range(self, value):
+        """Returns number of leading items of collection that are integers valid
+        for all validators if they all are :class:`Range` validators, so those
+        items do not need to be validated one by one. Stops at first item that
+        is not an integer or is out of range.
+        """
+        lowest, highest = float('-inf'), float('inf')
+        for validator in self.validators:
+            if type(validator) is not Range:
+                return 0
+            if validator.min is not None and validator.min > lowest:
+                lowest = validator.min
+            if validator.max is not None and validator.max < highest:
+                highest = validator.max
+
+        for idx, item in enumerate(value):
+            # Floats are not supported as NaN is not ordered
+            if type(item) not in int_types or not lowest <= item <= highest:
+                return idx
+
+        return len(value)
+
     def __call__(self, value, context=None):
         if not is_sequence(value):
             self._fail('invalid', data=value)
 
+        valid_count = self._count_in_range(value)
+        if valid_count == len(value):
+            return
+
         error_builder = ValidationErrorBuilder()
 
-        for idx, item in enumerate(value):
+        for idx, item in islice(enumerate(value), valid_count, None):
             for validator in self.validators:
                 try:
                     validator(item)
@@ -1,12 +1,72 @@
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+import pickle
 
 import pytest
 
-from lollipop.errors import ValidationError, ValidationErrorBuilder, merge_errors
+from lollipop.errors import ValidationError, ValidationErrorBuilder, \
+    ErrorMessagesMixin, merge_errors
 
 
 CustomError = namedtuple('CustomError', ['code', 'message'])
 
+class TestValidationError:
+    def test_messages(self):
+        assert ValidationError({'foo': 'error 1'}).messages == {'foo': 'error 1'}
+
+    def test_str(self):
+        assert str(ValidationError('error 1')) == "Invalid data: 'error 1'"
+        assert str(ValidationError(['error 1'])) == "Invalid data: ['error 1']"
+
+    def test_args(self):
+        assert ValidationError({'foo': 'error 1'}).args == ({'foo': 'error 1'},)
+
+    def test_pickling(self):
+        error = pickle.loads(pickle.dumps(ValidationError({'foo': 'error 1'})))
+        assert error.messages == {'foo': 'error 1'}
+
+
+class TestErrorMessagesMixin:
+    class Base(ErrorMessagesMixin):
+        default_error_messages = {'foo': 'Foo error', 'bar': 'Bar error'}
+
+        def fail(self, key):
+            self._fail(key)
+
+    class Derived(Base):
+        default_error_messages = {'bar': 'Derived bar error'}
+
+    def test_failing_with_default_message(self):
+        with pytest.raises(ValidationError) as exc_info:
+            self.Base().fail('foo')
+        assert exc_info.value.messages == 'Foo error'
+
+    def test_default_messages_are_inherited(self):
+        with pytest.raises(ValidationError) as exc_info:
+            self.Derived().fail('foo')
+        assert exc_info.value.messages == 'Foo error'
+
+        with pytest.raises(ValidationError) as exc_info:
+            self.Derived().fail('bar')
+        assert exc_info.value.messages == 'Derived bar error'
+
+        with pytest.raises(ValidationError) as exc_info:
+            self.Base().fail('bar')
+        assert exc_info.value.messages == 'Bar error'
+
+    def test_custom_messages_do_not_affect_other_instances(self):
+        with pytest.raises(ValidationError) as exc_info:
+            self.Base(error_messages={'foo': 'Custom error'}).fail('foo')
+        assert exc_info.value.messages == 'Custom error'
+
+        with pytest.raises(ValidationError) as exc_info:
+            self.Base().fail('foo')
+        assert exc_info.value.messages == 'Foo error'
+
+    def test_failing_with_unknown_message_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            self.Base().fail('baz')
+
+
 class TestMergeErrors:
 
     def test_merging_none_and_string(self):
@@ -121,6 +181,46 @@ class TestMergeErrors:
             merge_errors({'field1': {'field2': 'error1'}},
                          {'field1': {'field2': 'error2'}})
 
+    def test_merging_large_dicts(self):
+        errors1 = dict(('field%d' % i, 'error1') for i in range(50))
+        errors2 = dict(('field%d' % i, 'error2') for i in range(25, 75))
+        errors = merge_errors(errors1, errors2)
+
+        assert sorted(errors.keys()) == \
+            sorted('field%d' % i for i in range(75))
+        assert errors['field0'] == 'error1'
+        assert errors['field25'] == ['error1', 'error2']
+        assert errors['field74'] == 'error2'
+
+    def test_merging_with_dedup_removes_repeated_messages(self):
+        assert ['error1', 'error2'] == \
+            merge_errors(['error1', 'error2'], ['error2', 'error1'], dedup=True)
+
+    def test_merging_with_dedup_removes_repeated_nested_messages(self):
+        assert {'field1': ['error1'], 'field2': 'error2'} == \
+            merge_errors({'field1': 'error1', 'field2': 'error2'},
+                         {'field1': 'error1'}, dedup=True)
+
+    def test_merging_with_dedup_removes_repeated_custom_errors(self):
+        assert [CustomError(123, 'error1')] == \
+            merge_errors(CustomError(123, 'error1'), CustomError(123, 'error1'),
+                         dedup=True)
+
+    def test_merging_with_dedup_removes_repeated_unhashable_messages(self):
+        assert [{'field1': 'error1'}, 'error2'] == \
+            merge_errors([{'field1': 'error1'}, 'error2'],
+                         [{'field1': 'error1'}], dedup=True)
+
+    def test_merging_with_dedup_removes_repeated_messages_if_first_errors_are_None(self):
+        assert ['error1'] == merge_errors(None, ['error1', 'error1'], dedup=True)
+
+    def test_merging_with_dedup_removes_repeated_messages_if_second_errors_are_None(self):
+        assert {'field1': ['error1']} == \
+            merge_errors({'field1': ['error1', 'error1']}, None, dedup=True)
+
+    def test_merging_without_dedup_keeps_repeated_messages(self):
+        assert ['error1', 'error1'] == merge_errors('error1', 'error1')
+
 
 class TestValidationErrorBuilder:
 
@@ -154,12 +254,89 @@ class TestValidationErrorBuilder:
         assert {'foo': {'bar': 'error 1', 'baz': {'bam': 'error 2'}},
                 'quux': 'error 3'} == builder.errors
 
+    def test_adding_error_for_non_string_path(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error(1, 'error 1')
+        assert {1: 'error 1'} == builder.errors
+
+    def test_adding_errors_from_iterable(self):
+        builder = ValidationErrorBuilder()
+        builder.add_errors_from_iterable([
+            ('foo.bar', 'error 1'),
+            ('foo.baz.bam', 'error 2'),
+            ('quux', 'error 3'),
+            ('foo.bar', 'error 4'),
+            ('foo', 'error 5'),
+        ])
+        assert {'foo': {'bar': ['error 1', 'error 4'],
+                        'baz': {'bam': 'error 2'},
+                        '_schema': 'error 5'},
+                'quux': 'error 3'} == builder.errors
+
+    def test_adding_errors_from_iterable_merges_with_existing_errors(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error('foo.bar', 'error 1')
+        builder.add_errors_from_iterable([('foo.bar', 'error 2'),
+                                          ('foo.baz', 'error 3')])
+        assert {'foo': {'bar': ['error 1', 'error 2'], 'baz': 'error 3'}} == \
+            builder.errors
+
+    def test_adding_errors_from_empty_iterable(self):
+        builder = ValidationErrorBuilder()
+        builder.add_errors_from_iterable([])
+        assert None == builder.errors
+
     def test_adding_merging_errors(self):
         builder = ValidationErrorBuilder()
         builder.add_errors({'foo': {'bar': 'error 1'}})
         builder.add_errors({'foo': {'baz': 'error 2'}})
         assert {'foo': {'bar': 'error 1', 'baz': 'error 2'}} == builder.errors
 
+    def test_adding_errors_does_not_modify_given_errors(self):
+        errors1 = {'foo': {'bar': 'error 1'}}
+        errors2 = {'foo': {'baz': 'error 2'}, 'bam': 'error 3'}
+        builder = ValidationErrorBuilder()
+        builder.add_errors(errors1)
+        builder.add_errors(errors2)
+        assert {'foo': {'bar': 'error 1'}} == errors1
+        assert {'foo': {'baz': 'error 2'}, 'bam': 'error 3'} == errors2
+
+    def test_adding_errors_after_raising_does_not_modify_raised_errors(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error('a', 'x')
+        with pytest.raises(ValidationError) as excinfo:
+            builder.raise_errors()
+
+        builder.add_error('b', 'y')
+        builder.add_errors({'c': 'z'})
+        assert {'a': 'x'} == excinfo.value.messages
+        assert {'a': 'x', 'b': 'y', 'c': 'z'} == builder.errors
+
+    def test_adding_errors_does_not_modify_previously_read_errors(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error('a', 'x')
+        errors = builder.errors
+        builder.add_error('b', 'y')
+        assert {'a': 'x'} == errors
+        assert {'a': 'x', 'b': 'y'} == builder.errors
+
+    def test_adding_errors_does_not_modify_assigned_errors(self):
+        errors = {'a': 'x'}
+        builder = ValidationErrorBuilder()
+        builder.errors = errors
+        builder.add_error('b', 'y')
+        builder.add_errors({'c': 'z'})
+        assert {'a': 'x'} == errors
+        assert {'a': 'x', 'b': 'y', 'c': 'z'} == builder.errors
+
+    def test_adding_errors_of_dict_subclass(self):
+        errors = OrderedDict([('foo', 'error 1')])
+        builder = ValidationErrorBuilder()
+        builder.add_errors(errors)
+        builder.add_errors(OrderedDict([('bar', 'error 2')]))
+        assert {'foo': 'error 1', 'bar': 'error 2'} == builder.errors
+        assert OrderedDict([('foo', 'error 1')]) == errors
+
     def test_raise_errors_on_empty_builder_does_nothing(self):
         builder = ValidationErrorBuilder()
         builder.raise_errors()
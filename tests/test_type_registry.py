@@ -27,6 +27,11 @@ class TestTypeRegistry:
         my_type.load('foo')
         assert my_type.loaded == 'foo'
 
+    def test_getting_same_type_reference_for_same_name(self):
+        registry = TypeRegistry()
+        assert registry.get('type1') is registry.get('type1')
+        assert registry.get('type1') is not registry.get('type2')
+
     def test_raising_KeyError_if_using_unknown_type(self):
         registry = TypeRegistry()
         my_type = registry.get('type1')
@@ -40,6 +45,13 @@ class TestTypeRegistry:
         with pytest.raises(ValueError):
             registry.add('type1', SpyType())
 
+    def test_raising_ValueError_if_adding_same_type_twice(self):
+        my_type = SpyType()
+        registry = TypeRegistry()
+        registry.add('type1', my_type)
+        with pytest.raises(ValueError):
+            registry.add('type1', my_type)
+
     def test_getting_type_via_getitem(self):
         my_type = SpyType()
         registry = TypeRegistry()
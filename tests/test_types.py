@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 from functools import partial
 import datetime
@@ -8,7 +10,7 @@ from lollipop.types import MISSING, ValidationError, Type, Any, String, \
     Constant, Object, Optional, LoadOnly, DumpOnly, Transform, \
     type_name_hint, dict_value_hint, validated_type
 from lollipop.errors import merge_errors
-from lollipop.validators import Validator, Predicate
+from lollipop.validators import Validator, Predicate, Length
 from lollipop.utils import to_camel_case
 from collections import namedtuple
 import uuid
@@ -156,6 +158,24 @@ class ValidationTestsMixin:
                 .load(self.valid_data)
         assert exc_info.value.messages == [message1, message2]
 
+    def test_loading_uses_validators_added_after_loading(self):
+        message1 = 'Something went wrong'
+        tested_type = self.tested_type()
+        tested_type.load(self.valid_data)
+        tested_type.validators.append(constant_fail_validator(message1))
+        with pytest.raises(ValidationError) as exc_info:
+            tested_type.load(self.valid_data)
+        assert exc_info.value.messages == message1
+
+    def test_loading_uses_assigned_list_of_validators(self):
+        message1 = 'Something went wrong'
+        tested_type = self.tested_type()
+        tested_type.load(self.valid_data)
+        tested_type.validators = [constant_fail_validator(message1)]
+        with pytest.raises(ValidationError) as exc_info:
+            tested_type.load(self.valid_data)
+        assert exc_info.value.messages == message1
+
     def test_loading_passes_context_to_validator(self):
         context = object()
         validator = SpyValidator()
@@ -202,6 +222,21 @@ class TestString(NameDescriptionTestsMixin, RequiredTestsMixin, ValidationTestsM
             String().dump(123)
         assert exc_info.value.messages == String.default_error_messages['invalid']
 
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickling(self, protocol):
+        string_type = pickle.loads(pickle.dumps(
+            String(name='foo', validate=Length(max=3),
+                   error_messages={'invalid': 'Bad value'}),
+            protocol,
+        ))
+        assert string_type.name == 'foo'
+        assert string_type.load('foo') == 'foo'
+        with pytest.raises(ValidationError) as exc_info:
+            string_type.load(123)
+        assert exc_info.value.messages == 'Bad value'
+        with pytest.raises(ValidationError):
+            string_type.load('foobar')
+
 
 class TestNumber(NameDescriptionTestsMixin, RequiredTestsMixin, ValidationTestsMixin):
     tested_type = Number
@@ -254,6 +289,14 @@ class TestInteger:
         value = 10000000000000000000000000000000000000
         assert Integer().load(value) == value
 
+    def test_loading_integer_subclass_value_returns_integer(self):
+        class MyInt(int):
+            pass
+
+        result = Integer().load(MyInt(123))
+        assert result == 123
+        assert type(result) is int
+
     def test_loading_non_numeric_value_raises_ValidationError(self):
         with pytest.raises(ValidationError) as exc_info:
             Integer().load("abc")
@@ -749,6 +792,25 @@ class TestDict(NameDescriptionTestsMixin, RequiredTestsMixin, ValidationTestsMix
         assert Dict()\
             .load({'foo': 'bar', 'baz': 123}) == {'foo': 'bar', 'baz': 123}
 
+    def test_loading_returns_copy_if_value_types_are_not_specified(self):
+        data = {'foo': 'bar', 'baz': 123}
+        result = Dict().load(data)
+        assert result == data
+        assert result is not data
+
+    def test_loading_validates_values_of_any_type_with_validators(self):
+        message = 'Value should be string'
+        value_type = Any(validate=Predicate(lambda x: isinstance(x, str),
+                                            error=message))
+        with pytest.raises(ValidationError) as exc_info:
+            Dict(value_type).load({'foo': 'bar', 'baz': 123})
+        assert exc_info.value.messages == {'baz': message}
+
+    def test_loading_untyped_dict_preserves_ordering_when_requested(self):
+        value = OrderedDict([('foo', 1), ('bar', 2), ('baz', 3)])
+        result = Dict(ordered=True).load(value)
+        assert list(result.items()) == list(value.items())
+
     def test_loading_non_dict_value_raises_ValidationError(self):
         with pytest.raises(ValidationError) as exc_info:
             Dict(Integer()).load(['1', '2'])
@@ -901,6 +963,17 @@ class TestDict(NameDescriptionTestsMixin, RequiredTestsMixin, ValidationTestsMix
         ) == value
 
 
+class TestDictValueHint:
+    def test_returns_value_of_given_key(self):
+        assert dict_value_hint('type')({'type': 'foo', 'bar': 1}) == 'foo'
+
+    def test_returns_None_if_key_is_missing(self):
+        assert dict_value_hint('type')({'bar': 1}) is None
+
+    def test_applies_mapper_to_value(self):
+        assert dict_value_hint('type', str.capitalize)({'type': 'foo'}) == 'Foo'
+
+
 class TestOneOf:
     def test_loading_values_of_one_of_listed_types(self):
         one_of = OneOf([Integer(), String()])
@@ -1346,6 +1419,19 @@ class TestMethodField:
             .load_into(obj, 'foo', {'foo': 'goodbye', 'bar': 123})
         assert field_type.loaded == 'goodbye'
 
+    def test_loading_value_into_existing_object_does_not_get_old_value_if_load_into_is_not_available(self):
+        class NonLocal:
+            called = False
+
+        def get_foo():
+            NonLocal.called = True
+
+        obj = MethodDummy()
+        obj.get_foo = get_foo
+        MethodField(SpyType(), 'get_foo', 'set_foo')\
+            .load_into(obj, 'foo', {'foo': 'goodbye', 'bar': 123})
+        assert not NonLocal.called
+
     def test_loading_value_into_existing_object_calls_field_types_load_if_old_value_is_None(self):
         obj = MethodDummy(foo=None)
         field_type = SpyTypeWithLoadInto()
@@ -1633,6 +1719,82 @@ class TestObject(NameDescriptionTestsMixin, RequiredTestsMixin, ValidationTestsM
     def test_default_field_type_is_unset_by_default(self):
         assert Object({'x': String()}).default_field_type is None
 
+    def test_loading_values_that_compare_equal_to_anything(self):
+        class AnyValue(object):
+            def __eq__(self, other):
+                return True
+
+            def __ne__(self, other):
+                return False
+
+        value = AnyValue()
+        result = Object({'foo': Constant(value)}, constructor=dict)\
+            .load({'foo': value})
+        assert result['foo'] is value
+
+    def test_dumping_values_that_compare_equal_to_anything(self):
+        class AnyValue(object):
+            def __eq__(self, other):
+                return True
+
+            def __ne__(self, other):
+                return False
+
+        value = AnyValue()
+        result = Object({'foo': Constant(value)}).dump(object())
+        assert result['foo'] is value
+
+    def test_loading_fields_added_after_first_load(self):
+        obj_type = Object({'foo': String()}, allow_extra_fields=False)
+        assert obj_type.load({'foo': 'hello'}) == {'foo': 'hello'}
+
+        obj_type.fields['bar'] = AttributeField(Integer())
+        assert obj_type.load({'foo': 'hello', 'bar': 123}) == \
+            {'foo': 'hello', 'bar': 123}
+
+    def test_loading_does_not_use_fields_removed_after_first_load(self):
+        obj_type = Object({'foo': String(), 'bar': Integer()},
+                          allow_extra_fields=False)
+        obj_type.load({'foo': 'hello', 'bar': 123})
+
+        del obj_type.fields['bar']
+        with pytest.raises(ValidationError) as exc_info:
+            obj_type.load({'foo': 'hello', 'bar': 123})
+        assert exc_info.value.messages == \
+            {'bar': Object.default_error_messages['unknown']}
+
+    def test_dumping_fields_added_after_first_dump(self):
+        obj_type = Object({'foo': String()})
+        obj = AttributeDummy(foo='hello', bar=123)
+        assert obj_type.dump(obj) == {'foo': 'hello'}
+
+        obj_type.fields.update({'bar': AttributeField(Integer())})
+        assert obj_type.dump(obj) == {'foo': 'hello', 'bar': 123}
+
+    def test_loading_into_existing_object_fields_added_after_first_load(self):
+        obj_type = Object({'foo': String()}, allow_extra_fields=False)
+        obj = AttributeDummy(foo='hello', bar=123)
+        obj_type.load_into(obj, {'foo': 'goodbye'})
+
+        obj_type.fields['bar'] = AttributeField(Integer())
+        obj_type.load_into(obj, {'foo': 'hello', 'bar': 456})
+        assert obj.foo == 'hello'
+        assert obj.bar == 456
+
+    def test_copying_object(self):
+        obj_type = Object({'foo': String(), 'bar': List(Integer())})
+        obj_type_copy = copy.deepcopy(obj_type)
+        assert obj_type_copy.load({'foo': 'hello', 'bar': [1, 2]}) == \
+            obj_type.load({'foo': 'hello', 'bar': [1, 2]})
+
+    def test_subclasses_can_have_custom_attributes(self):
+        class MyObject(Object):
+            def __init__(self, *args, **kwargs):
+                super(MyObject, self).__init__(*args, **kwargs)
+                self.custom = 'foo'
+
+        assert MyObject({'foo': String()}).custom == 'foo'
+
     def test_inheriting_default_field_type_from_first_base_class_that_has_it_set(self):
         field_type = MethodField
         a = Object({'a': String()})
@@ -1,4 +1,8 @@
+import copy
+import gc
+import pickle
 import sys
+import weakref
 from lollipop.compat import iterkeys, itervalues, iteritems
 from lollipop.utils import call_with_context, to_camel_case, to_snake_case, \
     constant, identity, OpenStruct, DictWithDefault
@@ -104,6 +108,16 @@ class TestCallWithContext:
         context = object()
         assert call_with_context(str, context, 123) == '123'
 
+    def test_does_not_keep_called_functions_alive(self):
+        def func(a):
+            return a
+
+        func_ref = weakref.ref(func)
+        assert call_with_context(func, object(), 123) == 123
+        del func
+        gc.collect()
+        assert func_ref() is None
+
 
 class TestToCamelCase:
     def test_converting_snake_case_to_camel_case(self):
@@ -300,6 +314,28 @@ class TestOpenStruct:
         with pytest.raises(AttributeError):
             del o.foo
 
+    def test_copy(self):
+        o = OpenStruct({'foo': 'hello'})
+        o1 = copy.copy(o)
+        o1.bar = 123
+
+        assert o1.foo == 'hello'
+        assert 'bar' in o1
+        assert 'bar' in o
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickling(self, protocol):
+        o = pickle.loads(pickle.dumps(OpenStruct({'foo': 'hello'}), protocol))
+        assert dict(o.items()) == {'foo': 'hello'}
+        assert o.foo == 'hello'
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickling_empty(self, protocol):
+        o = pickle.loads(pickle.dumps(OpenStruct(), protocol))
+        assert len(o) == 0
+        o.foo = 'hello'
+        assert o['foo'] == 'hello'
+
 
 class TestDictWithDefault:
     def test_getitem(self):
@@ -324,6 +360,11 @@ class TestDictWithDefault:
         del d['bar']
         assert 'bar' not in d
 
+    def test_setitem_does_not_affect_other_instances(self):
+        d1 = DictWithDefault()
+        d1['foo'] = 'hello'
+        assert 'foo' not in DictWithDefault()
+
     def test_len(self):
         assert len(DictWithDefault({'a': 1, 'b': 5})) == 2
         assert len(DictWithDefault(default=3)) == 0
@@ -350,6 +391,14 @@ class TestDictWithDefault:
     def test_values(self):
         assert sorted(DictWithDefault({'a': 1, 'b': 2}).values()) == [1, 2]
 
+    def test_items(self):
+        assert sorted(DictWithDefault({'a': 1, 'b': 2}).items()) == \
+            [('a', 1), ('b', 2)]
+
+    def test_iteritems(self):
+        assert sorted(iteritems(DictWithDefault({'a': 1, 'b': 2}))) == \
+            [('a', 1), ('b', 2)]
+
     def test_get(self):
         assert DictWithDefault().get('foo') == None
         assert DictWithDefault(default=123).get('foo') == 123
@@ -357,3 +406,10 @@ class TestDictWithDefault:
     def test_get_with_custom_default(self):
         assert DictWithDefault().get('foo', 'hello') == 'hello'
         assert DictWithDefault(default=123).get('foo', 'hello') == 'hello'
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickling(self, protocol):
+        d = pickle.loads(pickle.dumps(DictWithDefault({'a': 1}, default=2),
+                                      protocol))
+        assert d['a'] == 1
+        assert d['b'] == 2
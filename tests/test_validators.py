@@ -6,6 +6,14 @@ from lollipop.errors import ValidationError
 import re
 
 
+class Incomparable(object):
+    """Unhashable value that can not be compared to anything."""
+    __hash__ = None
+
+    def __eq__(self, other):
+        raise TypeError('Can not compare')
+
+
 @contextmanager
 def not_raises(exception_type):
     try:
@@ -252,6 +260,41 @@ class TestNoneOf:
             NoneOf(['foo', 'bar'])('foo')
         assert exc_info.value.messages == NoneOf.default_error_messages['invalid']
 
+    def test_matching_unhashable_values(self):
+        with not_raises(ValidationError):
+            NoneOf([[1, 2], [3, 4]])([5, 6])
+
+        with not_raises(ValidationError):
+            NoneOf(['foo', 'bar'])(['foo'])
+
+        with raises(ValidationError):
+            NoneOf([[1, 2], [3, 4]])([1, 2])
+
+    def test_matching_unhashable_values_against_tuple(self):
+        with not_raises(ValidationError):
+            NoneOf(('foo', 'bar'))(['foo'])
+
+        with raises(ValidationError):
+            NoneOf(([1, 2], [3, 4]))([1, 2])
+
+    def test_propagating_errors_from_comparing_values(self):
+        with raises(TypeError):
+            NoneOf(('foo', 'bar'))(Incomparable())
+
+    def test_matching_values_added_to_given_values(self):
+        validator = NoneOf(['foo', 'bar'])
+        validator.values.append('baz')
+        with raises(ValidationError):
+            validator('baz')
+
+    def test_matching_reassigned_values(self):
+        validator = NoneOf(('foo', 'bar'))
+        validator.values = ('baz',)
+        with not_raises(ValidationError):
+            validator('foo')
+        with raises(ValidationError):
+            validator('baz')
+
     def test_customizing_error_message(self):
         message = 'Value {data} in {values}'
         with raises(ValidationError) as exc_info:
@@ -273,6 +316,38 @@ class TestAnyOf:
             AnyOf(['foo', 'bar'])('baz')
         assert exc_info.value.messages == AnyOf.default_error_messages['invalid']
 
+    def test_matching_unhashable_values(self):
+        with not_raises(ValidationError):
+            AnyOf([[1, 2], [3, 4]])([1, 2])
+
+        with raises(ValidationError):
+            AnyOf(['foo', 'bar'])(['foo'])
+
+    def test_matching_unhashable_values_against_tuple(self):
+        with not_raises(ValidationError):
+            AnyOf(([1, 2], [3, 4]))([1, 2])
+
+        with raises(ValidationError):
+            AnyOf(('foo', 'bar'))(['foo'])
+
+    def test_propagating_errors_from_comparing_values(self):
+        with raises(TypeError):
+            AnyOf(('foo', 'bar'))(Incomparable())
+
+    def test_matching_values_added_to_given_choices(self):
+        validator = AnyOf([1, 2])
+        validator.choices.append(3)
+        with not_raises(ValidationError):
+            validator(3)
+
+    def test_matching_reassigned_choices(self):
+        validator = AnyOf((1, 2))
+        validator.choices = (3,)
+        with not_raises(ValidationError):
+            validator(3)
+        with raises(ValidationError):
+            validator(1)
+
     def test_customizing_error_message(self):
         message = 'Value {data} not in {choices}'
         with raises(ValidationError) as exc_info:
@@ -392,3 +467,35 @@ class TestEach:
             Each([is_odd, is_small])([1, 2, 5, 7])
         assert exc_info.value.messages == {1: 'Value should be odd',
                                            3: 'Value should be small'}
+
+    def test_matching_collections_of_integers_in_given_ranges(self):
+        with not_raises(ValidationError):
+            Each([Range(min=1), Range(max=10)])([1, 5, 10])
+
+    def test_raising_ValidationError_if_integer_is_out_of_given_ranges(self):
+        with raises(ValidationError) as exc_info:
+            Each([Range(min=1), Range(max=10)])([0, 5, 11])
+        assert exc_info.value.messages == {
+            0: Range.default_error_messages['min'].format(min=1),
+            2: Range.default_error_messages['max'].format(max=10),
+        }
+
+    def test_raising_ValidationError_if_float_is_out_of_given_range(self):
+        nan = float('nan')
+        with raises(ValidationError) as exc_info:
+            Each(Range(min=0))([nan, -1.0])
+        assert exc_info.value.messages == {
+            1: Range.default_error_messages['min'].format(min=0),
+        }
+
+    def test_raising_ValidationError_if_integers_in_middle_of_collection_are_out_of_given_range(self):
+        value = list(range(1000))
+        value[500] = -1
+        value[501] = 501.5
+        value[700] = 2000
+        with raises(ValidationError) as exc_info:
+            Each(Range(min=0, max=1000))(value)
+        assert exc_info.value.messages == {
+            500: Range.default_error_messages['range'].format(min=0, max=1000),
+            700: Range.default_error_messages['range'].format(min=0, max=1000),
+        }